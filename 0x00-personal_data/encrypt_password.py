@@ -10,11 +10,19 @@ password and to validate a plain text password against a stored hashed version.
 bcrypt is a hashing algorithm designed specifically for securely storing
 passwords. It adds a salt to each password hash, making it more resistant
 to brute-force attacks.
+
+Environment Variables:
+    - BCRYPT_COST: bcrypt work factor (default: 10). Each increment
+      doubles the hashing time; production deployments should use 12+.
 """
 
+import os
 import bcrypt
 
 
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "10"))
+
+
 def hash_password(password: str) -> bytes:
     """
     Generates a salted and hashed password.
@@ -34,12 +42,12 @@ def hash_password(password: str) -> bytes:
     Example:
         >>> hashed = hash_password("my_secure_password")
         >>> print(hashed)
-        b'$2b$12$...'
+        b'$2b$10$...'
     """
     # Encode the password as bytes before hashing
     encoded = password.encode()
     # Generate a hashed password with bcrypt, which includes a salt
-    hashed = bcrypt.hashpw(encoded, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(encoded, bcrypt.gensalt(BCRYPT_COST))
 
     return hashed
 
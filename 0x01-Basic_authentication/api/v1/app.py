@@ -14,7 +14,7 @@ This module:
 """
 from os import getenv
 from api.v1.views import app_views
-from flask import Flask, jsonify, abort, request
+from flask import Flask, jsonify, abort, request, g
 from flask_cors import (CORS, cross_origin)
 
 app = Flask(__name__)
@@ -32,6 +32,10 @@ elif AUTH_TYPE == "basic_auth":
     from api.v1.auth.basic_auth import BasicAuth
     auth = BasicAuth()
 
+EXCLUDED_PATHS = ['/api/v1/status/',
+                  '/api/v1/unauthorized/',
+                  '/api/v1/forbidden/']
+
 
 @app.errorhandler(404)
 def not_found(error) -> str:
@@ -79,22 +83,20 @@ def before_request() -> str:
 
     - Skips validation for excluded paths.
     - Ensures requests include proper authorization headers.
-    - Verifies current user identity.
+    - Verifies current user identity and stores it as
+      `flask.g.current_user`.
     """
     if auth is None:
         return
 
-    excluded_paths = ['/api/v1/status/',
-                      '/api/v1/unauthorized/',
-                      '/api/v1/forbidden/']
-
-    if not auth.require_auth(request.path, excluded_paths):
+    if not auth.require_auth(request.path, EXCLUDED_PATHS):
         return
 
     if auth.authorization_header(request) is None:
         abort(401)
 
-    if auth.current_user(request) is None:
+    g.current_user = auth.current_user(request)
+    if g.current_user is None:
         abort(403)
 
 
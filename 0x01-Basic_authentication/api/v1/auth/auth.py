@@ -2,7 +2,19 @@
 """ Module of Authentication
 """
 from flask import request
-from typing import List, TypeVar
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple, TypeVar
+
+
+@lru_cache(maxsize=32)
+def _compile_excluded_paths(excluded_paths: Tuple[str, ...]
+                            ) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """ Splits excluded paths into exact paths and wildcard prefixes """
+    exact = frozenset(exc for exc in excluded_paths
+                      if exc and exc[-1] != '*')
+    prefixes = tuple(exc[:-1] for exc in excluded_paths
+                     if exc and exc[-1] == '*')
+    return exact, prefixes
 
 
 class Auth:
@@ -13,29 +25,14 @@ class Auth:
         if path is None or excluded_paths is None or excluded_paths == []:
             return True
 
-        l_path = len(path)
-        if l_path == 0:
+        if len(path) == 0:
             return True
 
-        slash_path = True if path[l_path - 1] == '/' else False
-
-        tmp_path = path
-        if not slash_path:
-            tmp_path += '/'
-
-        for exc in excluded_paths:
-            l_exc = len(exc)
-            if l_exc == 0:
-                continue
+        tmp_path = path if path[-1] == '/' else path + '/'
 
-            if exc[l_exc - 1] != '*':
-                if tmp_path == exc:
-                    return False
-            else:
-                if exc[:-1] == path[:l_exc - 1]:
-                    return False
+        exact, prefixes = _compile_excluded_paths(tuple(excluded_paths))
 
-        return True
+        return tmp_path not in exact and not path.startswith(prefixes)
 
     def authorization_header(self, request=None) -> str:
         """ Method that handles authorization header """
@@ -3,12 +3,28 @@
 """
 from api.v1.auth.auth import Auth
 from base64 import b64decode
+from collections import OrderedDict
+from hashlib import sha256
 from models.user import User
+from time import monotonic
 from typing import TypeVar
 
 
 class BasicAuth(Auth):
-    """ Basic Authentication Class """
+    """ Basic Authentication Class
+
+    Users resolved from an Authorization header are remembered for
+    USER_CACHE_TTL seconds, keyed by a hash of the header. A cached entry
+    is dropped as soon as the user is removed or changes email or
+    password.
+    """
+
+    USER_CACHE_SIZE = 128
+    USER_CACHE_TTL = 30
+
+    def __init__(self):
+        """ Initializes the user cache """
+        self._user_cache = OrderedDict()
 
     def extract_base64_authorization_header(self,
                                             authorization_header: str) -> str:
@@ -96,6 +112,16 @@ class BasicAuth(Auth):
         if not auth_header:
             return None
 
+        cache_key = sha256(auth_header.encode()).digest()
+        cached = self._user_cache.pop(cache_key, None)
+        if cached is not None:
+            user_id, email, pwd_hash, expires = cached
+            user = User.get(user_id)
+            if monotonic() < expires and user is not None \
+                    and user.email == email and user.password == pwd_hash:
+                self._user_cache[cache_key] = cached
+                return user
+
         encoded = self.extract_base64_authorization_header(auth_header)
 
         if not encoded:
@@ -113,4 +139,12 @@ class BasicAuth(Auth):
 
         user = self.user_object_from_credentials(email, pwd)
 
+        if user is not None:
+            self._user_cache[cache_key] = (
+                user.id, user.email, user.password,
+                monotonic() + self.USER_CACHE_TTL
+            )
+            if len(self._user_cache) > self.USER_CACHE_SIZE:
+                self._user_cache.popitem(last=False)
+
         return user
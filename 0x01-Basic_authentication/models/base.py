@@ -10,18 +10,95 @@ This module defines:
   - Support for CRUD operations (Create, Read, Update, Delete).
   - Searching and counting objects.
 
+Persistence:
+- `save` and `remove` append one JSON line to `.db_<Class>.jsonl`.
+- Journaled classes are compacted into `.db_<Class>.json` by a
+  background timer, once the journal grows past `FLUSH_THRESHOLD`
+  bytes, and at interpreter exit.
+
+Timestamps are serialized as ISO 8601 strings to the second
+(`YYYY-MM-DDTHH:MM:SS`).
+
 Global Constants:
-- `TIMESTAMP_FORMAT`: Defines the datetime format for serialization.
 - `DATA`: In-memory storage for objects by class name.
+- `COLUMNS`: Per class, `{attribute: {id: value}}` copies of the
+  attribute values of every saved object, scanned by `search`.
+- `INDEXES`: Per class, `{attribute: {value: {id: None}}}` lookup
+  tables for the attributes listed in `Base.INDEXED_ATTRIBUTES`.
+- `FLUSH_INTERVAL`: Seconds between background compactions.
+- `FLUSH_THRESHOLD`: Journal size in bytes that forces a compaction.
 """
 from datetime import datetime
 from typing import TypeVar, List, Iterable
 from os import path
+import atexit
 import json
+import os
+import threading
 import uuid
 
-TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DATA = {}
+COLUMNS = {}
+INDEXES = {}
+FLUSH_INTERVAL = 0.5
+FLUSH_THRESHOLD = 16 * 1024
+
+_DIRTY = set()
+_PENDING = 0
+_TIMER = None
+_LOCK = threading.RLock()
+
+
+def _dumps(obj) -> str:
+    """
+    Serialize `obj` to a JSON string, using orjson when available.
+
+    Args:
+        obj: JSON-compatible object.
+    Returns:
+        str: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(data: str):
+    """
+    Parse a JSON string, using orjson when available.
+
+    Args:
+        data (str): The JSON document.
+    Returns:
+        The decoded object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _flush():
+    """
+    Compact the journal of every dirty class into its JSON file.
+    """
+    global _PENDING, _TIMER
+    with _LOCK:
+        if _TIMER is not None:
+            _TIMER.cancel()
+            _TIMER = None
+        dirty = list(_DIRTY)
+        _DIRTY.clear()
+        _PENDING = 0
+        for cls in dirty:
+            cls.save_to_file()
+
+
+atexit.register(_flush)
 
 
 class Base:
@@ -32,8 +109,12 @@ class Base:
         id (str): Unique identifier for the object.
         created_at (datetime): Timestamp of creation.
         updated_at (datetime): Timestamp of the last update.
+        INDEXED_ATTRIBUTES (tuple): Attributes `search` can resolve
+            through `INDEXES` instead of scanning every object.
     """
 
+    INDEXED_ATTRIBUTES = ()
+
     def __init__(self, *args: list, **kwargs: dict):
         """
         Initialize a `Base` instance with optional attributes.
@@ -47,13 +128,29 @@ class Base:
             DATA[s_class] = {}
 
         self.id = kwargs.get('id', str(uuid.uuid4()))
-        self.created_at = datetime.strptime(
-            kwargs.get('created_at'), TIMESTAMP_FORMAT
+        self.created_at = datetime.fromisoformat(
+            kwargs.get('created_at')
         ) if kwargs.get('created_at') else datetime.utcnow()
-        self.updated_at = datetime.strptime(
-            kwargs.get('updated_at'), TIMESTAMP_FORMAT
+        self.updated_at = datetime.fromisoformat(
+            kwargs.get('updated_at')
         ) if kwargs.get('updated_at') else datetime.utcnow()
 
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Set an attribute, keeping `COLUMNS` and `INDEXES` in step when
+        the object is the one stored in `DATA`, so `search` always sees
+        the live attribute values.
+
+        Args:
+            name (str): Attribute name.
+            value: New attribute value.
+        """
+        super().__setattr__(name, value)
+        objs = DATA.get(self.__class__.__name__)
+        if objs is not None and objs.get(self.__dict__.get('id')) is self:
+            with _LOCK:
+                self._index()
+
     def __eq__(self, other: TypeVar('Base')) -> bool:
         """
         Compare equality between two `Base` objects.
@@ -78,57 +175,173 @@ class Base:
         for key, value in self.__dict__.items():
             if not for_serialization and key.startswith('_'):
                 continue
-            result[key] = value.strftime(
-                TIMESTAMP_FORMAT
+            result[key] = value.isoformat(
+                timespec='seconds'
             ) if isinstance(value, datetime) else value
         return result
 
     @classmethod
     def load_from_file(cls):
         """
-        Load all objects of the class from a JSON file.
+        Load all objects of the class from its JSON file, replay the
+        journal on top of it, then compact both into the JSON file.
         """
         s_class = cls.__name__
         file_path = f".db_{s_class}.json"
+        journal_path = f".db_{s_class}.jsonl"
         DATA[s_class] = {}
-        if not path.exists(file_path):
+
+        if path.exists(file_path):
+            with open(file_path, 'r') as f:
+                objs_json = _loads(f.read())
+                for obj_id, obj_json in objs_json.items():
+                    DATA[s_class][obj_id] = cls(**obj_json)
+
+        if not path.exists(journal_path):
+            cls._build_index()
             return
 
-        with open(file_path, 'r') as f:
-            objs_json = json.load(f)
-            for obj_id, obj_json in objs_json.items():
-                DATA[s_class][obj_id] = cls(**obj_json)
+        with open(journal_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = _loads(line)
+                if entry.get('op') == 'remove':
+                    DATA[s_class].pop(entry.get('id'), None)
+                else:
+                    obj_json = entry.get('obj')
+                    DATA[s_class][obj_json['id']] = cls(**obj_json)
+
+        cls._build_index()
+        cls.save_to_file()
+
+    @classmethod
+    def _build_index(cls):
+        """
+        Rebuild the attribute columns and indexes of the class
+        from `DATA`.
+        """
+        COLUMNS[cls.__name__] = {}
+        INDEXES[cls.__name__] = {attr: {} for attr in cls.INDEXED_ATTRIBUTES}
+        for obj in DATA[cls.__name__].values():
+            obj._index()
+
+    def _index(self):
+        """
+        Record the current attribute values of the object in `COLUMNS`
+        and `INDEXES`, dropping the entries of a previous save.
+
+        Unhashable values are only kept in `COLUMNS`, where `search`
+        still finds them by scanning.
+        """
+        s_class = self.__class__.__name__
+        self._unindex()
+        values = dict(self.__dict__)
+        for attr in self.INDEXED_ATTRIBUTES:
+            values[attr] = getattr(self, attr, None)
+
+        columns = COLUMNS.setdefault(s_class, {})
+        for attr, value in values.items():
+            columns.setdefault(attr, {})[self.id] = value
+
+        indexes = INDEXES.setdefault(s_class, {})
+        for attr in self.INDEXED_ATTRIBUTES:
+            try:
+                ids = indexes.setdefault(attr, {}).setdefault(values[attr], {})
+            except TypeError:
+                continue
+            ids[self.id] = None
+
+    def _unindex(self):
+        """
+        Drop the `COLUMNS` and `INDEXES` entries of the object.
+        """
+        s_class = self.__class__.__name__
+        columns = COLUMNS.get(s_class, {})
+        indexes = INDEXES.get(s_class, {})
+        for attr in self.INDEXED_ATTRIBUTES:
+            column = columns.get(attr, {})
+            if self.id not in column:
+                continue
+            value = column[self.id]
+            try:
+                ids = indexes.get(attr, {}).get(value)
+            except TypeError:
+                continue
+            if ids is None:
+                continue
+            ids.pop(self.id, None)
+            if not ids:
+                del indexes[attr][value]
+
+        for column in columns.values():
+            column.pop(self.id, None)
 
     @classmethod
     def save_to_file(cls):
         """
-        Save all objects of the class to a JSON file.
+        Save all objects of the class to a JSON file and truncate
+        the class journal.
         """
         s_class = cls.__name__
         file_path = f".db_{s_class}.json"
-        objs_json = {obj_id: obj.to_json(True)
-                     for obj_id, obj in DATA[s_class].items()}
+        journal_path = f".db_{s_class}.jsonl"
+        with _LOCK:
+            objs_json = {obj_id: obj.to_json(True)
+                         for obj_id, obj in DATA[s_class].items()}
+
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(_dumps(objs_json))
+            os.replace(tmp_path, file_path)
+
+            if path.exists(journal_path):
+                os.remove(journal_path)
+
+    @classmethod
+    def _journal(cls, entry: dict):
+        """
+        Append an entry to the class journal and schedule compaction.
 
-        with open(file_path, 'w') as f:
-            json.dump(objs_json, f)
+        Args:
+            entry (dict): Journal entry (`op` plus `obj` or `id`).
+        """
+        global _PENDING, _TIMER
+        line = _dumps(entry) + "\n"
+        with _LOCK:
+            with open(f".db_{cls.__name__}.jsonl", 'a') as f:
+                f.write(line)
+            _DIRTY.add(cls)
+            _PENDING += len(line)
+            if _PENDING >= FLUSH_THRESHOLD:
+                _flush()
+            elif _TIMER is None:
+                _TIMER = threading.Timer(FLUSH_INTERVAL, _flush)
+                _TIMER.daemon = True
+                _TIMER.start()
 
     def save(self):
         """
-        Save the current object to in-memory storage and file.
+        Save the current object to in-memory storage and journal.
         """
         s_class = self.__class__.__name__
         self.updated_at = datetime.utcnow()
-        DATA[s_class][self.id] = self
-        self.__class__.save_to_file()
+        with _LOCK:
+            self._index()
+            DATA[s_class][self.id] = self
+            self.__class__._journal({'op': 'save',
+                                     'obj': self.to_json(True)})
 
     def remove(self):
         """
-        Remove the object from in-memory storage and file.
+        Remove the object from in-memory storage and journal.
         """
         s_class = self.__class__.__name__
-        if DATA[s_class].get(self.id):
-            del DATA[s_class][self.id]
-            self.__class__.save_to_file()
+        with _LOCK:
+            if DATA[s_class].get(self.id):
+                del DATA[s_class][self.id]
+                self._unindex()
+                self.__class__._journal({'op': 'remove', 'id': self.id})
 
     @classmethod
     def count(cls) -> int:
@@ -167,6 +380,12 @@ class Base:
         """
         Search for objects with matching attributes.
 
+        Each attribute is matched through `INDEXES` when indexed, or
+        by scanning its column in `COLUMNS`, and the resulting id sets
+        are intersected. Lookups of `None`, which also matches objects
+        missing the attribute, and of attributes no stored object has
+        fall back to a scan over all objects.
+
         Args:
             attributes (dict): Attributes to match.
         Returns:
@@ -178,4 +397,30 @@ class Base:
                 for k, v in attributes.items()
             )
 
-        return list(filter(_search, DATA[cls.__name__].values()))
+        objs = DATA[cls.__name__]
+        if not attributes:
+            return list(objs.values())
+        if any(v is None for v in attributes.values()):
+            return list(filter(_search, list(objs.values())))
+
+        columns = COLUMNS.get(cls.__name__, {})
+        indexes = INDEXES.get(cls.__name__, {})
+        matches = []
+        for k, v in attributes.items():
+            if k in indexes:
+                try:
+                    matches.append(dict(indexes[k].get(v, {})))
+                    continue
+                except TypeError:
+                    pass
+            if k not in columns:
+                return list(filter(_search, list(objs.values())))
+            matches.append({oid: None
+                            for oid, value in list(columns[k].items())
+                            if value == v})
+
+        matches.sort(key=len)
+        ids, others = matches[0], matches[1:]
+        return [objs[i] for i in ids
+                if i in objs and all(i in m for m in others)
+                and _search(objs[i])]
@@ -4,6 +4,8 @@ API Routes for Authentication Service
 This module provides a Flask-based API for user authentication,
 including registration, login, session management, and password
 reset functionality.
+
+JSON responses are serialized with orjson when it is installed.
 """
 
 from auth import Auth
@@ -14,10 +16,43 @@ from flask import (
     abort,
     redirect
 )
+from flask.json.provider import JSONProvider
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serializes `obj` to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserializes a JSON string or bytes."""
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 AUTH = Auth()
 
+WELCOME = app.json.dumps({"message": "Bienvenue"})
+
+
+@app.teardown_appcontext
+def close_db_session(exception=None) -> None:
+    """
+    Ends the request thread's database session so its connection
+    goes back to the pool.
+    """
+    AUTH._db.close()
+
 
 @app.route('/', methods=['GET'])
 def hello_world() -> str:
@@ -26,7 +61,7 @@ def hello_world() -> str:
     Returns:
         JSON with a welcome message.
     """
-    return jsonify({"message": "Bienvenue"})
+    return app.response_class(WELCOME, mimetype="application/json")
 
 
 @app.route('/users', methods=['POST'])
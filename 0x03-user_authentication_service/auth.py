@@ -4,6 +4,10 @@
 This module provides the `Auth` class for user authentication,
 handling user registration, login, session management, and
 password reset functionalities.
+
+Environment Variables:
+    - BCRYPT_COST: bcrypt work factor (default: 10). Each increment
+      doubles the hashing time; production deployments should use 12+.
 """
 
 import bcrypt
@@ -11,7 +15,10 @@ from db import DB
 from sqlalchemy.orm.exc import NoResultFound
 from typing import Union
 from user import User
-from uuid import uuid4
+import os
+import secrets
+
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "10"))
 
 
 def _hash_password(password: str) -> str:
@@ -23,21 +30,25 @@ def _hash_password(password: str) -> str:
     Returns:
         str: Salted and hashed password.
     """
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_COST))
 
 
 def _generate_uuid() -> str:
-    """Generates a new UUID.
+    """Generates a new random session or reset token.
 
     Returns:
-        str: String representation of the UUID.
+        str: 32 hex characters (128 bits) from the OS CSPRNG.
     """
-    return str(uuid4())
+    return secrets.token_hex(16)
 
 
 class Auth:
     """Handles user authentication and interaction with the database."""
 
+    # Checked against on unknown emails so failed logins cost one bcrypt
+    # whether or not the account exists
+    _DUMMY_HASH = bcrypt.hashpw(b"x", bcrypt.gensalt(BCRYPT_COST))
+
     def __init__(self):
         """Initializes the Auth class."""
         self._db = DB()
@@ -75,6 +86,7 @@ class Auth:
         try:
             user = self._db.find_user_by(email=email)
         except NoResultFound:
+            bcrypt.checkpw(password.encode(), self._DUMMY_HASH)
             return False
 
         return bcrypt.checkpw(password.encode(), user.hashed_password)
@@ -165,4 +177,5 @@ class Auth:
             raise ValueError
 
         hashed_password = _hash_password(password)
-        self._db.update_user(user.id, hashed_password=hashed_password, reset_token=None)
+        self._db.update_user(user.id, hashed_password=hashed_password,
+                             reset_token=None)
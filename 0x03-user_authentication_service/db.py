@@ -3,39 +3,81 @@
 
 This module provides the `DB` class for database interactions, including
 user creation, querying, and updating with SQLAlchemy.
+
+Environment Variables:
+    - DB_RESET: When set to "1", existing tables are dropped on start-up.
 """
 
-from sqlalchemy import create_engine
+from os import getenv
+from sqlalchemy import create_engine, event, update
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy.pool import QueuePool
 from typing import TypeVar
 from user import Base, User
 
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tunes every new SQLite connection of the pool.
+
+    WAL lets readers proceed while a write is in progress.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class DB:
     """Handles database operations using SQLAlchemy ORM."""
 
     def __init__(self):
         """Initializes the database connection and tables."""
-        self._engine = create_engine("sqlite:///a.db", echo=False)
-        Base.metadata.drop_all(self._engine)  # Clears existing tables
-        Base.metadata.create_all(self._engine)  # Creates new tables
+        self._engine = create_engine(
+            "sqlite:///a.db",
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=10,
+        )
+        event.listen(self._engine, "connect", _set_sqlite_pragmas)
+        if getenv("DB_RESET") == "1":
+            Base.metadata.drop_all(self._engine)  # Clears existing tables
+        Base.metadata.create_all(self._engine)  # Creates missing tables
         self.__session = None
 
     @property
     def _session(self):
         """Lazy loads the database session.
 
+        The session is thread-local, so concurrent requests served by
+        different threads never share one.
+
         Returns:
-            Session: SQLAlchemy session instance.
+            scoped_session: SQLAlchemy session registry proxy.
         """
         if self.__session is None:
-            DBSession = sessionmaker(bind=self._engine)
-            self.__session = DBSession()
+            self.__session = scoped_session(sessionmaker(bind=self._engine))
         return self.__session
 
+    def close(self) -> None:
+        """Ends the calling thread's session.
+
+        The session's connection is returned to the pool; the next
+        access to `_session` from this thread starts a new session.
+        """
+        if self.__session is not None:
+            self.__session.remove()
+
     def add_user(self, email: str, hashed_password: str) -> User:
         """Adds a new user to the database.
 
@@ -73,31 +115,49 @@ class DB:
             if key not in column_names:
                 raise InvalidRequestError
 
-        user = self._session.query(User).filter_by(**kwargs).first()
+        if list(kwargs) == ['id']:
+            # Primary key lookups are served from the identity map
+            user = self._session.get(User, kwargs['id'])
+        else:
+            user = self._session.query(User).filter_by(**kwargs).first()
 
         if user is None:
             raise NoResultFound
 
         return user
 
-    def update_user(self, user_id: int, **kwargs) -> None:
+    def update_user(self, user_id: int, commit: bool = True,
+                    **kwargs) -> None:
         """Updates a user's attributes in the database.
 
+        All attributes are written with a single UPDATE statement.
+
         Args:
             user_id (int): ID of the user to update.
+            commit (bool): Commit the transaction right away. Callers
+                           chaining several writes pass False and commit
+                           once through `_session.commit()`.
             **kwargs: Key-value pairs of attributes to update.
 
         Raises:
             ValueError: If an invalid column name is used.
+            NoResultFound: If no user has the given ID.
         """
-        user = self.find_user_by(id=user_id)
-
         column_names = User.__table__.columns.keys()
         for key in kwargs.keys():
             if key not in column_names:
                 raise ValueError
 
-        for key, value in kwargs.items():
-            setattr(user, key, value)
+        if not kwargs:
+            if commit:
+                self._session.commit()
+            return
+
+        result = self._session.execute(
+            update(User).where(User.id == user_id).values(**kwargs)
+        )
+        if result.rowcount == 0:
+            raise NoResultFound
 
-        self._session.commit()
+        if commit:
+            self._session.commit()